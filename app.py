@@ -1,11 +1,13 @@
 import tkinter as tk
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk
 import numpy as np
 import matplotlib.pyplot as plt
 
 from lib.functions import functions
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from lib.solution import Solution
+from lib.solution import Solution, methods
 
 
 class HeatEquationApp:
@@ -27,15 +29,20 @@ class HeatEquationApp:
         boundary_value_left (tk.DoubleVar): Valor de contorno em x=0.
         boundary_value_right (tk.DoubleVar): Valor de contorno em x=L.
         initial_func_name (tk.StringVar): Nome da função de condição inicial.
+        method_name (tk.StringVar): Nome do método de avanço temporal.
         current_step (int): Passo atual da simulação sendo visualizado.
         x_axis_min (tk.DoubleVar): Valor mínimo do eixo x no gráfico.
         x_axis_max (tk.DoubleVar): Valor máximo do eixo x no gráfico.
         y_axis_min (tk.DoubleVar): Valor mínimo do eixo y no gráfico.
         y_axis_max (tk.DoubleVar): Valor máximo do eixo y no gráfico.
         use_fixed_limits (tk.BooleanVar): Se True, usa limites fixos no gráfico.
+        line (matplotlib.lines.Line2D): Curva do gráfico, atualizada a cada passo.
+        pool (ThreadPoolExecutor): Thread de trabalho que calcula as soluções.
+        job (concurrent.futures.Future): Cálculo da solução em andamento, se houver.
+        cancel (threading.Event): Sinal que interrompe o cálculo em andamento ao fechar.
         solution (Solution): Instância da classe Solution com a solução calculada.
         x (numpy.ndarray): Valores de x (coordenadas espaciais).
-        U (numpy.ndarray): Matriz com todas as soluções temporais u(x,t).
+        U (SolutionHistory): Histórico das soluções temporais u(x,t), indexável pelo passo.
     """
 
     def __init__(self, root):
@@ -56,6 +63,7 @@ class HeatEquationApp:
         self.boundary_value_left = tk.DoubleVar(value=None)
         self.boundary_value_right = tk.DoubleVar(value=None)
         self.initial_func_name = tk.StringVar(value="sin(pi*x)")
+        self.method_name = tk.StringVar(value="crank-nicolson")
         self.current_step = 0
 
         self.x_axis_min = tk.DoubleVar(value=0.0)
@@ -64,9 +72,26 @@ class HeatEquationApp:
         self.y_axis_max = tk.DoubleVar(value=1.5)
         self.use_fixed_limits = tk.BooleanVar(value=False)
 
+        self.pool = ThreadPoolExecutor(max_workers=1)
+        self.job = None
+        self.cancel = threading.Event()
+        self.root.protocol("WM_DELETE_WINDOW", self.close)
+
         self.create_widgets()
         self.update_solution()
 
+    def close(self):
+        """
+        Encerra a thread de trabalho e fecha a janela principal.
+        
+        Sinaliza o cancelamento do cálculo em andamento, que para ao fim do trecho
+        atual (cerca de sqrt(nt) passos), de modo que o interpretador espera no
+        máximo esse trecho antes de encerrar.
+        """
+        self.cancel.set()
+        self.pool.shutdown(wait=False, cancel_futures=True)
+        self.root.destroy()
+
     def set_solution(self):
         """
         Cria uma nova instância da solução com os parâmetros atuais.
@@ -77,9 +102,10 @@ class HeatEquationApp:
         initial_func = self.initial_func_name.get()
         alpha = self.alpha.get()
         L = self.L.get()
-        nx = self.nx.get()
+        nx = int(self.nx.get())
         T = self.T.get()
-        nt = self.nt.get()
+        nt = int(self.nt.get())
+        method = self.method_name.get()
 
         left_value = None
         right_value = None
@@ -97,7 +123,8 @@ class HeatEquationApp:
         except:
             pass
 
-        self.solution = Solution(initial_func, alpha, L, nx, T, nt, left_value, right_value)
+        self.solution = Solution(
+            initial_func, alpha, L, nx, T, nt, left_value, right_value, method)
 
     def create_widgets(self):
         """
@@ -135,11 +162,17 @@ class HeatEquationApp:
         ttk.Label(frame, text="u(L,t):").grid(row=7, column=0)
         ttk.Entry(frame, textvariable=self.boundary_value_right).grid(row=7, column=1)
 
-        ttk.Button(frame, text="Atualizar gráfico", command=self.update_solution).grid(
-            row=8, column=0, columnspan=2, pady=10)
+        ttk.Label(frame, text="Método:").grid(row=8, column=0)
+        method_menu = ttk.Combobox(
+            frame, textvariable=self.method_name, values=list(methods.keys()))
+        method_menu.grid(row=8, column=1)
+
+        self.update_button = ttk.Button(
+            frame, text="Atualizar gráfico", command=self.update_solution)
+        self.update_button.grid(row=9, column=0, columnspan=2, pady=10)
 
         nav_frame = ttk.Frame(frame)
-        nav_frame.grid(row=9, column=0, columnspan=2, pady=5)
+        nav_frame.grid(row=10, column=0, columnspan=2, pady=5)
 
         ttk.Button(nav_frame, text="|<<", command=self.first_step).pack(
             side=tk.LEFT, padx=5)
@@ -154,7 +187,7 @@ class HeatEquationApp:
         self.step_label.pack(side=tk.LEFT, padx=10)
 
         jump_frame = ttk.Frame(frame)
-        jump_frame.grid(row=10, column=0, columnspan=2, pady=5)
+        jump_frame.grid(row=11, column=0, columnspan=2, pady=5)
 
         ttk.Label(jump_frame, text="Ir para passo:").pack(side=tk.LEFT, padx=5)
         self.jump_step_var = tk.IntVar(value=0)
@@ -165,7 +198,7 @@ class HeatEquationApp:
             side=tk.LEFT, padx=5)
 
         axis_frame = ttk.LabelFrame(frame, text="Limites dos Eixos")
-        axis_frame.grid(row=11, column=0, columnspan=2, pady=5, sticky="ew")
+        axis_frame.grid(row=12, column=0, columnspan=2, pady=5, sticky="ew")
 
         ttk.Checkbutton(axis_frame, text="Usar limites fixos", variable=self.use_fixed_limits).grid(
             row=0, column=0, columnspan=2, sticky="w")
@@ -197,20 +230,46 @@ class HeatEquationApp:
         """
         Atualiza a solução e o gráfico.
         
-        Cria uma nova solução com os parâmetros atuais, calcula-a,
-        atualiza os limites dos eixos, e exibe o primeiro passo da solução.
+        Cria uma nova solução com os parâmetros atuais e envia o cálculo para uma
+        thread de trabalho, para não bloquear a interface. O botão de atualização
+        fica desabilitado até que finish_solution receba o resultado.
         
         Raises:
-            Exception: Erro durante o cálculo ou atualização do gráfico.
+            Exception: Erro ao criar a solução com os parâmetros informados.
         """
         try:
             self.set_solution()
-            self.x, self.U = self.solution.solve()
+        except Exception as e:
+            print("Erro ao atualizar o gráfico:", e)
+            return
+
+        self.update_button.state(["disabled"])
+        self.job = self.pool.submit(self.solution.solve_checkpointed, self.cancel)
+        self.root.after(50, self.finish_solution)
+
+    def finish_solution(self):
+        """
+        Exibe a solução calculada em segundo plano quando o cálculo termina.
+        
+        Enquanto o cálculo não termina, volta a se agendar no laço de eventos do Tk.
+        Ao terminar, atualiza os limites dos eixos e exibe o primeiro passo da solução.
+        
+        Raises:
+            Exception: Erro durante o cálculo ou atualização do gráfico.
+        """
+        if not self.job.done():
+            self.root.after(50, self.finish_solution)
+            return
+
+        self.update_button.state(["!disabled"])
+        try:
+            self.x, self.U = self.job.result()
 
-            x_min_data = min(self.x)
-            x_max_data = max(self.x)
-            y_min_data = min(self.U.min(), -0.1)
-            y_max_data = max(self.U.max(), 0.1)
+            x_min_data = self.x[0]
+            x_max_data = self.x[-1]
+            u_min, u_max = self.U.min(), self.U.max()
+            y_min_data = min(u_min, -0.1)
+            y_max_data = max(u_max, 0.1)
 
             x_margin = (x_max_data - x_min_data) * 0.05
             y_margin = (y_max_data - y_min_data) * 0.05
@@ -220,30 +279,49 @@ class HeatEquationApp:
             self.y_axis_min.set(y_min_data - y_margin)
             self.y_axis_max.set(y_max_data + y_margin)
 
+            self.reset_plot(self.x, self.U)
             self.set_step(0)
             self.plot(self.x, self.U)
         except Exception as e:
             print("Erro ao atualizar o gráfico:", e)
 
-    def plot(self, x, U):
+    def reset_plot(self, x, U):
         """
-        Plota a solução para o passo atual.
+        Recria os eixos e a curva do gráfico para uma nova solução.
+        
+        A curva criada aqui é reaproveitada por plot, que só troca seus valores de y
+        ao navegar entre os passos, sem reconstruir eixos, marcações e rótulos.
         
         Args:
             x (numpy.ndarray): Coordenadas espaciais.
-            U (numpy.ndarray): Matriz de soluções para todos os passos temporais.
+            U (SolutionHistory): Histórico das soluções para todos os passos temporais.
         """
         self.ax.clear()
-        self.ax.plot(x, U[self.current_step])
-        self.ax.set_title(f"Solução da Equação do Calor - Passo {self.current_step}")
+        self.line, = self.ax.plot(x, U[0])
         self.ax.set_xlabel("x")
         self.ax.set_ylabel("u(x,t)")
 
+    def plot(self, x, U):
+        """
+        Plota a solução para o passo atual.
+        
+        Args:
+            x (numpy.ndarray): Coordenadas espaciais.
+            U (SolutionHistory): Histórico das soluções para todos os passos temporais.
+        """
+        self.line.set_ydata(U[self.current_step])
+        self.ax.set_title(f"Solução da Equação do Calor - Passo {self.current_step}")
+
         if self.use_fixed_limits.get():
             self.ax.set_xlim(self.x_axis_min.get(), self.x_axis_max.get())
             self.ax.set_ylim(self.y_axis_min.get(), self.y_axis_max.get())
+        else:
+            # set_xlim/set_ylim desligam o autoscale; é preciso religá-lo aqui.
+            self.ax.autoscale(True)
+            self.ax.relim()
+            self.ax.autoscale_view()
 
-        self.canvas.draw()
+        self.canvas.draw_idle()
 
     def increment_step(self, amount: int):
         """
@@ -253,13 +331,12 @@ class HeatEquationApp:
             amount (int): Quantidade a ser adicionada ao passo atual.
             
         Returns:
-            bool: True se o incremento foi bem-sucedido, False caso contrário.
+            bool: True se o passo atual mudou, False caso contrário.
         """
         new_step = self.current_step + amount
         if not hasattr(self, 'U') or new_step >= len(self.U) or new_step < 0:
             return False
-        self.set_step(new_step)
-        return True
+        return self.set_step(new_step)
 
     def next_step(self):
         """
@@ -281,11 +358,16 @@ class HeatEquationApp:
         
         Args:
             index (int): Índice do passo a ser definido.
+            
+        Returns:
+            bool: True se o passo atual mudou, ou seja, se o gráfico precisa ser redesenhado.
         """
+        changed = self.current_step != index
         self.current_step = index
         total_steps = len(self.U) if hasattr(self, 'U') else 0
         self.step_label.config(text=f"Passo: {self.current_step}/{total_steps - 1}")
         self.jump_step_var.set(self.current_step)
+        return changed
 
     def apply_axis_limits(self):
         """
@@ -318,8 +400,8 @@ class HeatEquationApp:
             jump_step = self.jump_step_var.get()
             if hasattr(self, 'U'):
                 if 0 <= jump_step < len(self.U):
-                    self.set_step(jump_step)
-                    self.plot(self.x, self.U)
+                    if self.set_step(jump_step):
+                        self.plot(self.x, self.U)
                 else:
                     print(
                         f"Valor de passo inválido. Deve estar entre 0 e {len(self.U) - 1}")
@@ -333,8 +415,8 @@ class HeatEquationApp:
         Vai para o primeiro passo da simulação.
         """
         if hasattr(self, 'U') and len(self.U) > 0:
-            self.set_step(0)
-            self.plot(self.x, self.U)
+            if self.set_step(0):
+                self.plot(self.x, self.U)
         else:
             print("Solução não disponível. Atualize o gráfico primeiro.")
 
@@ -343,8 +425,8 @@ class HeatEquationApp:
         Vai para o último passo da simulação.
         """
         if hasattr(self, 'U') and len(self.U) > 0:
-            self.set_step(len(self.U) - 1)
-            self.plot(self.x, self.U)
+            if self.set_step(len(self.U) - 1):
+                self.plot(self.x, self.U)
         else:
             print("Solução não disponível. Atualize o gráfico primeiro.")
 
@@ -6,11 +6,37 @@ para a simulação da equação do calor. Cada função toma como entrada um arr
 de coordenadas espaciais e retorna os valores correspondentes da temperatura inicial.
 """
 
+from functools import lru_cache
+
 import numpy as np
 
 # Dicionário de funções disponíveis para condições iniciais
 functions = {
     "sin(pi*x)": lambda x: np.sin(np.pi*x),
     "x*(1 - x)": lambda x: x*(1-x),
-    "x": lambda x: x
-}
\ No newline at end of file
+    "x": lambda x: x.copy()
+}
+
+
+@lru_cache(maxsize=32)
+def initial_condition(name: str, nx: int, L: float, dtype=np.float64):
+    """
+    Avalia uma função inicial em uma malha uniforme de nx pontos em [0, L].
+
+    O resultado é memorizado, de modo que recriar a solução mudando apenas
+    alpha, T, nt ou os contornos não reavalia a função. O array retornado é
+    somente leitura; quem precisar alterá-lo deve trabalhar sobre uma cópia.
+
+    Args:
+        name (str): Nome da função inicial, uma das chaves de functions.
+        nx (int): Número de pontos espaciais.
+        L (float): Comprimento da barra.
+        dtype (numpy.dtype, optional): Tipo de ponto flutuante da malha.
+
+    Returns:
+        numpy.ndarray: Valores da função inicial em cada ponto da malha.
+    """
+    x = np.linspace(0, L, nx, dtype=dtype)
+    u = np.asarray(functions[name](x))
+    u.flags.writeable = False
+    return u
@@ -1,6 +1,307 @@
-from lib.functions import functions
+from concurrent.futures import CancelledError
+from functools import lru_cache
+
+from lib.functions import functions, initial_condition
+from scipy.linalg import get_blas_funcs, solve_banded
 import numpy as np
 
+try:
+    from numba import cuda, njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    cuda = None
+    prange = range
+
+    def njit(*args, **kwargs):
+        """
+        Substituto de numba.njit quando o Numba não está instalado.
+        
+        Devolve a função decorada sem compilá-la, de modo que os kernels continuem
+        definidos; methods passa então a usar os caminhos baseados em NumPy.
+        """
+        if args and callable(args[0]):
+            return args[0]
+        return lambda function: function
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Nomes das funções iniciais, usados nas mensagens de erro
+_FUNC_NAMES = tuple(functions)
+
+# Assinaturas compiladas antecipadamente para os kernels Numba, para U em
+# float64 e float32; r é sempre double e nt, nx são inteiros de 64 bits.
+_KERNEL_SIGNATURES = ["void(f8[:, ::1], f8, i8, i8)", "void(f4[:, ::1], f8, i8, i8)"]
+
+# A partir deste número de pontos o método explícito distribui o laço espacial
+# entre as threads; abaixo disso o custo de disparar as threads domina.
+_PARALLEL_MIN_NX = 10_000
+
+# A partir deste número de pontos o caminho NumPy do método explícito (sem Numba
+# nem numexpr) passa a usar as rotinas axpy/scal do BLAS.
+_BLAS_MIN_NX = 100_000
+
+# A partir deste volume de trabalho (nt × nx) o método explícito compila um kernel
+# específico para o valor de r; abaixo disso a compilação custa mais do que economiza.
+_SPECIALIZE_MIN_WORK = 50_000_000
+
+# A partir deste tamanho (número de alphas × nx) solve_batch usa a GPU, se houver.
+_BATCH_GPU_MIN_SIZE = 100_000
+
+# Número de threads por bloco do kernel CUDA de solve_batch.
+_BATCH_GPU_THREADS = 128
+
+
+@njit(_KERNEL_SIGNATURES, cache=True, nogil=True, fastmath=True)
+def _advance(U, r, nt, nx):
+    """
+    Avança o esquema explícito de diferenças finitas sobre a matriz U.
+
+    Escreve cada linha U[n+1] a partir de U[n], mantendo intactas as colunas
+    de contorno, que já devem estar preenchidas.
+
+    Args:
+        U (numpy.ndarray): Matriz (nt+1, nx) com a condição inicial na linha 0.
+        r (float): Fator de estabilidade (alpha*dt/dx²).
+        nt (int): Número de passos temporais.
+        nx (int): Número de pontos espaciais.
+    """
+    # Forma (1-2r)·u[i] + r·(u[i-1] + u[i+1]), que vira uma cadeia de FMAs.
+    a = 1.0 - 2.0 * r
+    for n in range(nt):
+        for i in range(1, nx - 1):
+            U[n + 1, i] = a * U[n, i] + r * (U[n, i - 1] + U[n, i + 1])
+
+
+@njit(_KERNEL_SIGNATURES, cache=True, nogil=True, parallel=True, fastmath=True)
+def _advance_parallel(U, r, nt, nx):
+    """
+    Avança o esquema explícito distribuindo o laço espacial entre as threads.
+
+    Args:
+        U (numpy.ndarray): Matriz (nt+1, nx) com a condição inicial na linha 0.
+        r (float): Fator de estabilidade (alpha*dt/dx²).
+        nt (int): Número de passos temporais.
+        nx (int): Número de pontos espaciais.
+    """
+    a = 1.0 - 2.0 * r
+    for n in range(nt):
+        for i in prange(1, nx - 1):
+            U[n + 1, i] = a * U[n, i] + r * (U[n, i - 1] + U[n, i + 1])
+
+
+@lru_cache(maxsize=8)
+def _make_advancer(r):
+    """
+    Compila uma versão de _advance especializada para um valor fixo de r.
+
+    O valor de r entra no kernel como constante de compilação, o que permite
+    ao LLVM dobrar as multiplicações por r e por 1-2r ao incorporar _advance.
+    As versões compiladas são mantidas para os últimos valores de r usados.
+
+    Args:
+        r (float): Fator de estabilidade (alpha*dt/dx²).
+
+    Returns:
+        callable: Kernel com assinatura (U, nt, nx).
+    """
+    @njit(nogil=True, fastmath=True)
+    def advance(U, nt, nx):
+        _advance(U, r, nt, nx)
+
+    return advance
+
+
+def _advance_vectorized(U, r, nt, nx):
+    """
+    Avança o esquema explícito com operações vetorizadas, sem o Numba.
+
+    Com o numexpr instalado, cada passo é avaliado em uma única expressão
+    fundida, em blocos e em várias threads, sem criar arrays intermediários.
+    Sem ele, usa NumPy com um buffer preenchido in-place ou, para malhas com
+    pelo menos _BLAS_MIN_NX pontos, as rotinas axpy e scal do BLAS.
+
+    Args:
+        U (numpy.ndarray): Matriz (nt+1, nx) com a condição inicial na linha 0.
+        r (float): Fator de estabilidade (alpha*dt/dx²).
+        nt (int): Número de passos temporais.
+        nx (int): Número de pontos espaciais.
+    """
+    r = U.dtype.type(r)
+    a = U.dtype.type(1.0 - 2.0 * r)
+    if numexpr is not None:
+        for n in range(nt):
+            numexpr.evaluate(
+                "a*uc + r*(ul + ur)",
+                local_dict={"a": a, "r": r, "uc": U[n, 1:-1], "ul": U[n, :-2], "ur": U[n, 2:]},
+                out=U[n + 1, 1:-1])
+        return
+
+    if nx >= _BLAS_MIN_NX:
+        axpy, scal = get_blas_funcs(("axpy", "scal"), (U,))
+        for n in range(nt):
+            new = U[n + 1, 1:-1]
+            new[:] = U[n, :-2]
+            axpy(U[n, 2:], new, a=1.0)
+            scal(r, new)
+            axpy(U[n, 1:-1], new, a=a)
+        return
+
+    for n in range(nt):
+        new = U[n + 1, 1:-1]
+        np.add(U[n, :-2], U[n, 2:], out=new)
+        new *= r
+        new += a * U[n, 1:-1]
+
+
+def _advance_explicit(U, r, nt, nx):
+    """
+    Avança o esquema explícito, em paralelo apenas para malhas grandes.
+
+    Em execuções seriais longas, usa um kernel especializado no valor de r.
+    Sem o Numba, recorre a _advance_vectorized.
+
+    Args:
+        U (numpy.ndarray): Matriz (nt+1, nx) com a condição inicial na linha 0.
+        r (float): Fator de estabilidade (alpha*dt/dx²).
+        nt (int): Número de passos temporais.
+        nx (int): Número de pontos espaciais.
+    """
+    if not NUMBA_AVAILABLE:
+        _advance_vectorized(U, r, nt, nx)
+    elif nx > _PARALLEL_MIN_NX:
+        _advance_parallel(U, r, nt, nx)
+    elif nt * nx >= _SPECIALIZE_MIN_WORK:
+        _make_advancer(float(r))(U, nt, nx)
+    else:
+        _advance(U, r, nt, nx)
+
+
+@njit(_KERNEL_SIGNATURES, cache=True, nogil=True, fastmath=True)
+def _advance_crank_nicolson(U, r, nt, nx):
+    """
+    Avança o esquema de Crank–Nicolson sobre a matriz U.
+
+    A cada passo resolve o sistema tridiagonal
+    -r/2 u[i-1] + (1+r) u[i] - r/2 u[i+1] = r/2 v[i-1] + (1-r) v[i] + r/2 v[i+1]
+    pelo algoritmo de Thomas. Como a matriz não muda entre passos, os
+    coeficientes da eliminação são fatorados uma única vez fora do laço
+    temporal; cada passo faz só a varredura direta e a substituição reversa,
+    usando a própria linha U[n+1] como vetor de trabalho.
+
+    Args:
+        U (numpy.ndarray): Matriz (nt+1, nx) com a condição inicial na linha 0
+            e as colunas de contorno preenchidas.
+        r (float): Fator de estabilidade (alpha*dt/dx²).
+        nt (int): Número de passos temporais.
+        nx (int): Número de pontos espaciais.
+    """
+    m = nx - 2
+    if m <= 0:
+        return
+
+    a = -0.5 * r
+    b = 1.0 + r
+    c_hat = np.empty(m)
+    inv = np.empty(m)
+    inv[0] = 1.0 / b
+    c_hat[0] = a * inv[0]
+    for k in range(1, m):
+        inv[k] = 1.0 / (b - a * c_hat[k - 1])
+        c_hat[k] = a * inv[k]
+
+    h = 0.5 * r
+    for n in range(nt):
+        prev = 0.0
+        for k in range(m):
+            i = k + 1
+            d = h * U[n, i - 1] + (1.0 - r) * U[n, i] + h * U[n, i + 1]
+            if k == 0:
+                d += h * U[n + 1, 0]
+            if k == m - 1:
+                d += h * U[n + 1, nx - 1]
+            prev = (d - a * prev) * inv[k]
+            U[n + 1, i] = prev
+        for i in range(m - 1, 0, -1):
+            U[n + 1, i] -= c_hat[i - 1] * U[n + 1, i + 1]
+
+
+def _advance_crank_nicolson_banded(U, r, nt, nx):
+    """
+    Avança o esquema de Crank–Nicolson usando scipy.linalg.solve_banded.
+
+    Equivalente a _advance_crank_nicolson, mas delega a solução do sistema
+    tridiagonal à rotina compilada do SciPy (LAPACK). A matriz em formato de
+    banda e o vetor do lado direito são alocados uma única vez.
+
+    Args:
+        U (numpy.ndarray): Matriz (nt+1, nx) com a condição inicial na linha 0
+            e as colunas de contorno preenchidas.
+        r (float): Fator de estabilidade (alpha*dt/dx²).
+        nt (int): Número de passos temporais.
+        nx (int): Número de pontos espaciais.
+    """
+    m = nx - 2
+    if m <= 0:
+        return
+
+    ab = np.empty((3, m))
+    ab[0] = -0.5 * r
+    ab[1] = 1.0 + r
+    ab[2] = -0.5 * r
+    rhs = np.empty(m)
+
+    h = 0.5 * r
+    for n in range(nt):
+        np.multiply(U[n, 1:-1], 1.0 - r, out=rhs)
+        rhs += h * (U[n, :-2] + U[n, 2:])
+        rhs[0] += h * U[n + 1, 0]
+        rhs[-1] += h * U[n + 1, -1]
+        U[n + 1, 1:-1] = solve_banded(
+            (1, 1), ab, rhs, overwrite_b=True, check_finite=False)
+
+
+def _advance_batch_cuda(V, r, nt, nx):
+    """
+    Avança o esquema explícito para vários valores de r na GPU.
+
+    Cada bloco cuida de um valor de r e suas threads percorrem os pontos
+    espaciais com passo blockDim.x. As duas linhas de V[:, m] se alternam como
+    estado atual e próximo estado, sincronizando o bloco a cada passo.
+
+    Args:
+        V (numba.cuda.devicearray.DeviceNDArray): Array (2, M, nx) com a condição
+            inicial replicada nas duas linhas de cada um dos M sistemas.
+        r (numba.cuda.devicearray.DeviceNDArray): Fatores de estabilidade, um por sistema.
+        nt (int): Número de passos temporais.
+        nx (int): Número de pontos espaciais.
+    """
+    m = cuda.blockIdx.x
+    rm = r[m]
+    am = 1.0 - 2.0 * rm
+    for n in range(nt):
+        src = n % 2
+        dst = 1 - src
+        for i in range(cuda.threadIdx.x + 1, nx - 1, cuda.blockDim.x):
+            V[dst, m, i] = am * V[src, m, i] + rm * (V[src, m, i - 1] + V[src, m, i + 1])
+        cuda.syncthreads()
+
+
+if NUMBA_AVAILABLE:
+    _advance_batch_cuda = cuda.jit(_advance_batch_cuda)
+
+
+# Métodos de avanço temporal disponíveis
+methods = {
+    "crank-nicolson": (
+        _advance_crank_nicolson if NUMBA_AVAILABLE else _advance_crank_nicolson_banded),
+    "crank-nicolson-banded": _advance_crank_nicolson_banded,
+    "explicito": _advance_explicit,
+}
+
 
 class InitialState:
     """
@@ -11,7 +312,8 @@ class InitialState:
     
     Attributes:
         x (numpy.ndarray): Coordenadas espaciais discretizadas.
-        u (numpy.ndarray): Valores iniciais da temperatura em cada ponto de x.
+        u (numpy.ndarray): Valores iniciais da temperatura em cada ponto de x. Sem
+            contornos sobrescritos, é o próprio array values recebido, se houver.
     """
     
     def __init__(
@@ -19,7 +321,8 @@ class InitialState:
             function: str,
             x,
             left_boundary: None | float = None,
-            right_boundary: None | float = None):
+            right_boundary: None | float = None,
+            values=None):
         """
         Inicializa o estado inicial da equação.
         
@@ -28,36 +331,172 @@ class InitialState:
             x (numpy.ndarray): Coordenadas espaciais discretizadas.
             left_boundary (float, optional): Valor da temperatura na extremidade esquerda (x=0).
             right_boundary (float, optional): Valor da temperatura na extremidade direita (x=L).
+            values (numpy.ndarray, optional): Função inicial já avaliada em x, como a
+                devolvida por initial_condition; nunca é alterado. Se omitido, a função
+                é avaliada em x.
             
         Raises:
             ValueError: Se a função especificada não estiver na lista de funções disponíveis.
         """
-        if function not in list(functions.keys()):
+        if function not in functions:
             raise ValueError(
-                f"A função escolhida deve constar na lista {list(functions.keys())}")
+                f"A função escolhida deve constar na lista {list(_FUNC_NAMES)}")
         self.x = x
-        self.u: list[float] = functions[function](x)
-        if left_boundary is not None:
-            self.u[0] = left_boundary
-        if right_boundary is not None:
-            self.u[-1] = right_boundary
+        if values is None:
+            # Array recém-avaliado, do próprio InitialState: os contornos entram in-place.
+            self.u: np.ndarray = functions[function](x)
+            if left_boundary is not None:
+                self.u[0] = left_boundary
+            if right_boundary is not None:
+                self.u[-1] = right_boundary
+            return
+
+        if left_boundary is None and right_boundary is None:
+            self.u = values
+            return
+
+        # values pode ser o array memorizado, somente leitura: monta uma cópia
+        # com os contornos em uma única passada.
+        self.u = np.empty_like(values)
+        self.u[1:-1] = values[1:-1]
+        self.u[0] = values[0] if left_boundary is None else left_boundary
+        self.u[-1] = values[-1] if right_boundary is None else right_boundary
 
     def get_u(self):
         """
         Retorna os valores iniciais da temperatura.
         
         Returns:
-            numpy.ndarray: Valores iniciais da temperatura em cada ponto de x.
+            numpy.ndarray: Valores iniciais da temperatura em cada ponto de x, que não
+                devem ser alterados.
         """
         return self.u
 
 
+class SolutionHistory:
+    """
+    Histórico da solução reconstruído sob demanda a partir de checkpoints.
+    
+    Em vez de armazenar os nt+1 estados da temperatura, guarda apenas um estado a
+    cada `interval` passos. Ao acessar um passo, o trecho entre o checkpoint anterior
+    e o seguinte é recalculado em um buffer de `interval`+1 linhas e reaproveitado
+    enquanto os acessos permanecerem no mesmo trecho. Com interval ≈ sqrt(nt), a
+    memória cai de O(nt·nx) para O(sqrt(nt)·nx).
+    
+    Attributes:
+        r (float): Fator de estabilidade (alpha*dt/dx²).
+        nt (int): Número de passos temporais.
+        nx (int): Número de pontos espaciais.
+        interval (int): Número de passos entre checkpoints consecutivos.
+        checkpoints (list): Estados da temperatura nos passos múltiplos de interval.
+    """
+    
+    def __init__(self, advance, r: float, nt: int, u0, interval: int, cancel=None):
+        """
+        Avança a solução uma vez do início ao fim, guardando os checkpoints.
+        
+        Args:
+            advance (callable): Função de avanço temporal, uma das entradas de methods.
+            r (float): Fator de estabilidade (alpha*dt/dx²).
+            nt (int): Número de passos temporais.
+            u0 (numpy.ndarray): Estado inicial da temperatura, incluindo os contornos.
+            interval (int): Número de passos entre checkpoints consecutivos.
+            cancel (threading.Event, optional): Sinal de cancelamento, verificado entre
+                um trecho e outro.
+            
+        Raises:
+            CancelledError: Se cancel for sinalizado antes do fim do avanço.
+        """
+        self.advance = advance
+        self.r = r
+        self.nt = nt
+        self.nx = len(u0)
+        self.interval = interval
+        self.checkpoints = [u0.copy()]
+        self._buffer = np.empty((interval + 1, self.nx), dtype=u0.dtype)
+        self._buffer[:, 0] = u0[0]
+        self._buffer[:, -1] = u0[-1]
+        self._segment = None
+        self._min = u0.min()
+        self._max = u0.max()
+
+        for segment in range((nt + interval - 1) // interval):
+            if cancel is not None and cancel.is_set():
+                raise CancelledError("Cálculo da solução cancelado")
+            steps = self._advance_segment(segment)
+            self.checkpoints.append(self._buffer[steps].copy())
+            self._min = min(self._min, self._buffer[1:steps + 1].min())
+            self._max = max(self._max, self._buffer[1:steps + 1].max())
+
+    def _advance_segment(self, segment: int):
+        """
+        Recalcula no buffer o trecho que começa no checkpoint indicado.
+        
+        Args:
+            segment (int): Índice do checkpoint inicial do trecho.
+            
+        Returns:
+            int: Número de passos calculados no trecho.
+        """
+        steps = min(self.interval, self.nt - segment * self.interval)
+        self._buffer[0] = self.checkpoints[segment]
+        self.advance(self._buffer, self.r, steps, self.nx)
+        self._segment = segment
+        return steps
+
+    def __len__(self):
+        return self.nt + 1
+
+    def __getitem__(self, n: int):
+        """
+        Retorna o estado da temperatura no passo n.
+        
+        Args:
+            n (int): Índice do passo temporal; valores negativos contam a partir do fim.
+            
+        Returns:
+            numpy.ndarray: Cópia do estado da temperatura no passo n.
+            
+        Raises:
+            IndexError: Se n estiver fora do intervalo de passos.
+        """
+        if n < 0:
+            n += self.nt + 1
+        if not 0 <= n <= self.nt:
+            raise IndexError(f"O passo deve estar entre 0 e {self.nt}")
+        segment, offset = divmod(n, self.interval)
+        if offset == 0:
+            return self.checkpoints[segment].copy()
+        if self._segment != segment:
+            self._advance_segment(segment)
+        return self._buffer[offset].copy()
+
+    def min(self):
+        """
+        Retorna a menor temperatura ao longo de toda a simulação.
+        
+        Returns:
+            float: Valor calculado durante o avanço inicial, sem recalcular a solução.
+        """
+        return self._min
+
+    def max(self):
+        """
+        Retorna a maior temperatura ao longo de toda a simulação.
+        
+        Returns:
+            float: Valor calculado durante o avanço inicial, sem recalcular a solução.
+        """
+        return self._max
+
+
 class Solution:
     """
     Classe que implementa a solução numérica da equação do calor por diferenças finitas.
     
-    Utiliza o método explícito de diferenças finitas para resolver a equação do calor
-    unidimensional com as condições iniciais e de contorno especificadas.
+    Utiliza o método de Crank–Nicolson (ou, opcionalmente, o método explícito) de
+    diferenças finitas para resolver a equação do calor unidimensional com as
+    condições iniciais e de contorno especificadas.
     
     Attributes:
         alpha (float): Coeficiente de difusão térmica.
@@ -65,11 +504,13 @@ class Solution:
         nx (int): Número de pontos espaciais.
         T (float): Tempo final da simulação.
         nt (int): Número de passos temporais.
+        method (str): Método de avanço temporal.
+        dtype (numpy.dtype): Tipo de ponto flutuante de x e da matriz U.
         r (float): Fator de estabilidade (alpha*dt/dx²).
         x (numpy.ndarray): Coordenadas espaciais discretizadas.
         initial_state (InitialState): Estado inicial da equação.
         u (numpy.ndarray): Estado atual da temperatura.
-        U (list): Lista de todos os estados da temperatura em cada passo temporal.
+        U (numpy.ndarray | SolutionHistory): Estados da temperatura em cada passo temporal.
     """
     
     def __init__(
@@ -77,11 +518,13 @@ class Solution:
             initial_function: str,
             alpha: float,
             L: float,
-            nx: float,
+            nx: int,
             T: float,
-            nt: float,
+            nt: int,
             left_boundary: float | None = None,
             right_boundary: float | None = None,
+            method: str = "crank-nicolson",
+            dtype=np.float64,
     ):
         """
         Inicializa a solução da equação do calor.
@@ -90,56 +533,152 @@ class Solution:
             initial_function (str): Nome da função de condição inicial.
             alpha (float): Coeficiente de difusão térmica.
             L (float): Comprimento da barra.
-            nx (float): Número de pontos espaciais.
+            nx (int): Número de pontos espaciais.
             T (float): Tempo final da simulação.
-            nt (float): Número de passos temporais.
+            nt (int): Número de passos temporais.
             left_boundary (float, optional): Temperatura na extremidade esquerda (x=0).
             right_boundary (float, optional): Temperatura na extremidade direita (x=L).
+            method (str, optional): Método de avanço temporal, uma das chaves de methods.
+            dtype (numpy.dtype, optional): Tipo de ponto flutuante usado para armazenar a
+                solução. np.float32 reduz pela metade a memória ocupada por U.
+
+        Raises:
+            ValueError: Se o método especificado não estiver na lista de métodos disponíveis.
         """
+        if method not in methods:
+            raise ValueError(
+                f"O método escolhido deve constar na lista {list(methods.keys())}")
+        self.method = method
+        self.dtype = np.dtype(dtype)
         self.alpha = alpha
         self.L = L
         self.nx = nx
         self.T = T
         self.nt = nt
         self.r = self.calculate_r()
-        self.x = np.linspace(0, L, nx)
-        self.initial_state = InitialState(initial_function, self.x, left_boundary, right_boundary)
+        self.x = np.linspace(0, L, nx, dtype=self.dtype)
+        # Um nome inválido não é avaliado aqui; InitialState é quem o rejeita.
+        values = None
+        if initial_function in functions:
+            values = initial_condition(initial_function, nx, L, self.dtype)
+        self.initial_state = InitialState(
+            initial_function, self.x, left_boundary, right_boundary, values)
         self.u = self.initial_state.get_u()
-        self.U = [self.u.copy()]
+        self.U = None
     
-    def calculate_r(self):
+    def calculate_r(self, alpha: float | None = None):
         """
         Calcula o fator de estabilidade r = alpha*dt/dx².
         
+        Args:
+            alpha (float, optional): Coeficiente de difusão térmica; por padrão, self.alpha.
+        
         Returns:
             float: Valor do fator de estabilidade.
             
         Raises:
-            ValueError: Se r > 0.5, o que tornaria o método explícito instável.
+            ValueError: Se r > 0.5 com o método explícito, que seria instável.
         """
+        if alpha is None:
+            alpha = self.alpha
         dx = self.L / self.nx
         dt = self.T / self.nt
-        r = self.alpha * dt / dx ** 2
-        if r > 0.5:
+        r = alpha * dt / dx ** 2
+        if self.method == "explicito" and r > 0.5:
             raise ValueError("O método explícito é instável para r > 0.5")
         return r
     
     def solve(self):
         """
-        Resolve a equação do calor pelo método de diferenças finitas explícito.
+        Resolve a equação do calor pelo método de diferenças finitas escolhido.
         
-        Implementa o esquema explícito de diferenças finitas para resolver a equação
+        Implementa o esquema de diferenças finitas escolhido para resolver a equação
         do calor unidimensional. A solução avança no tempo para cada passo temporal.
         
         Returns:
             tuple: Um par (x, U), onde x são as coordenadas espaciais e 
                   U é uma matriz com todos os estados da temperatura ao longo do tempo.
         """
-        for n in range(self.nt):
-            u_new = self.u.copy()
-            u_new[1:-1] = self.u[1:-1] + self.r * (self.u[2:] - 2 * self.u[1:-1] + self.u[:-2])
-            self.U.append(u_new)
-            self.u = u_new
+        U = np.empty((self.nt + 1, self.nx), dtype=self.dtype)
+        U[0] = self.u
+        U[:, 0] = self.u[0]
+        U[:, -1] = self.u[-1]
+
+        methods[self.method](U, self.r, self.nt, self.nx)
+
+        self.U = U
+        self.u = U[-1]
+        return self.x, U
+
+    def solve_checkpointed(self, cancel=None):
+        """
+        Resolve a equação do calor guardando apenas checkpoints da solução.
+        
+        Equivalente a solve, mas devolve um SolutionHistory, que recalcula sob demanda
+        os passos entre checkpoints espaçados de aproximadamente sqrt(nt) passos.
+        
+        Args:
+            cancel (threading.Event, optional): Sinal que interrompe o cálculo ao fim
+                do trecho em andamento.
+        
+        Returns:
+            tuple: Um par (x, U), onde x são as coordenadas espaciais e 
+                  U é um SolutionHistory indexável pelo passo temporal.
+            
+        Raises:
+            CancelledError: Se cancel for sinalizado antes do fim do cálculo.
+        """
+        interval = max(1, int(np.sqrt(self.nt)))
+        U = SolutionHistory(
+            methods[self.method], self.r, self.nt, self.u, interval, cancel)
+
+        self.U = U
+        self.u = U[-1]
+        return self.x, U
+
+    def solve_batch(self, alphas):
+        """
+        Resolve a equação do calor para vários coeficientes de difusão de uma vez.
+        
+        Todos os sistemas compartilham a malha, o estado inicial e os contornos, e
+        apenas o estado final de cada um é devolvido. Com o método explícito e uma
+        GPU CUDA disponível, lotes com pelo menos _BATCH_GPU_MIN_SIZE pontos
+        (len(alphas) × nx) são avançados em um único kernel, um bloco por alpha.
+        Nos demais casos cada alpha é avançado na CPU em trechos de aproximadamente
+        sqrt(nt) passos, reaproveitando um único buffer.
+        
+        Args:
+            alphas (numpy.ndarray): Coeficientes de difusão térmica.
+            
+        Returns:
+            numpy.ndarray: Matriz (len(alphas), nx) com o estado final de cada alpha.
+            
+        Raises:
+            ValueError: Se algum alpha tornar o método explícito instável.
+        """
+        alphas = np.asarray(alphas, dtype=np.float64)
+        r = np.array([self.calculate_r(alpha) for alpha in alphas])
+        u0 = self.initial_state.get_u()
 
-        return self.x, np.array(self.U)
+        if (self.method == "explicito" and NUMBA_AVAILABLE and cuda.is_available()
+                and len(alphas) * self.nx >= _BATCH_GPU_MIN_SIZE):
+            V = np.empty((2, len(alphas), self.nx), dtype=self.dtype)
+            V[:] = u0
+            d_V = cuda.to_device(V)
+            _advance_batch_cuda[len(alphas), _BATCH_GPU_THREADS](
+                d_V, cuda.to_device(r), self.nt, self.nx)
+            return d_V[self.nt % 2].copy_to_host()
 
+        interval = max(1, int(np.sqrt(self.nt)))
+        buffer = np.empty((interval + 1, self.nx), dtype=self.dtype)
+        buffer[:, 0] = u0[0]
+        buffer[:, -1] = u0[-1]
+        final = np.empty((len(alphas), self.nx), dtype=self.dtype)
+        for m in range(len(alphas)):
+            buffer[0] = u0
+            for start in range(0, self.nt, interval):
+                steps = min(interval, self.nt - start)
+                methods[self.method](buffer, r[m], steps, self.nx)
+                buffer[0] = buffer[steps]
+            final[m] = buffer[0]
+        return final